@@ -1,5 +1,14 @@
+import os
 import sys
 import time
+import queue
+import asyncio
+import pickle
+import inspect
+import threading
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+from collections import deque, Counter
 
 from botocore.exceptions import ClientError
 
@@ -7,6 +16,10 @@ from orgcrawler import utils
 
 
 DEFAULT_REGION = 'us-east-1'
+DEFAULT_MAX_WORKERS = 20
+DEFAULT_ASYNC_CONCURRENCY = 200
+EXECUTION_MODES = ['thread', 'async', 'process']
+RESPONSE_QUEUE_SIZE = 1000
 
 
 class Crawler(object):
@@ -19,6 +32,12 @@ class Crawler(object):
         :access_role: string
         :accounts: string, list of string, or list of OrgAccount
         :regions: string, or list of string
+        :max_workers: int, most payload or credential tasks run at once
+            [Default: DEFAULT_MAX_WORKERS]
+        :max_per_account: int, most payload tasks run at once in any one
+            account [Default: no limit]
+        :max_per_region: int, most payload tasks run at once in any one
+            region [Default: no limit]
         """
         self.org = org
         self.access_role = kwargs.get('access_role') or org.access_role
@@ -29,6 +48,12 @@ class Crawler(object):
         self.executions = []
         self.exc_info = None
         self.error = None
+        self.max_workers = kwargs.get('max_workers') or DEFAULT_MAX_WORKERS
+        self.max_per_account = kwargs.get('max_per_account')
+        self.max_per_region = kwargs.get('max_per_region')
+        self._worker_pool = None
+        self._process_pool = None
+        self._process_count = None
 
     def is_valid_account(self, account):
         if self.org.get_account(account) is None:
@@ -83,66 +108,420 @@ class Crawler(object):
             self.accounts = accounts
             self.validate_accounts()
 
+    def _get_worker_pool(self, thread_count=None):
+        """
+        Return the Crawler's worker pool, which is kept and reused across
+        calls as long as ``thread_count`` does not change.
+        """
+        thread_count = max(1, thread_count or self.max_workers)
+        if self._worker_pool is None or self._worker_pool.max_workers != thread_count:
+            if self._worker_pool is not None:
+                self._worker_pool.shutdown(wait=False)
+            self._worker_pool = utils.WorkerPool(max_workers=thread_count)
+        return self._worker_pool
+
     def load_account_credentials(self):
         def get_credentials_for_account(account, crawler):
-            try:
-                account.load_credentials(crawler.access_role)
-            except ClientError as e:    # pragma: no cover
-                crawler.error = 'cannot assume role {} in account {}: {}'.format(
-                    crawler.access_role,
-                    account.name,
-                    e.response['Error']['Code']
-                )
-            except Exception:   # pragma: no cover
-                crawler.exc_info = sys.exc_info()
-        utils.queue_threads(
-            self.accounts,
+            account.load_credentials(crawler.access_role)
+
+        results = self._get_worker_pool().map(
             get_credentials_for_account,
+            self.accounts,
             func_args=(self,),
-            thread_count=len(self.accounts)
         )
+        for result in results:
+            if result.exc_info is None:
+                continue
+            exception = result.exc_info[1]
+            if isinstance(exception, ClientError):  # pragma: no cover
+                self.error = 'cannot assume role {} in account {}: {}'.format(
+                    self.access_role,
+                    result.item.name,
+                    exception.response['Error']['Code']
+                )
+            else:   # pragma: no cover
+                self.exc_info = result.exc_info
         if self.error:  # pragma: no cover
             sys.exit(self.error)
         if self.exc_info:   # pragma: no cover
             raise self.exc_info[1].with_traceback(self.exc_info[2])
 
-    def execute(self, payload, *args, **kwargs):
+    def execute(self, payload, *args, mode=None, thread_count=None, concurrency=None,
+            **kwargs):
+        """
+        Run ``payload(region, account, *args, **kwargs)`` for every account
+        and region.
+
+        ``mode`` selects how payloads are run [Default: 'async' for coroutine
+        functions (``async def``), 'thread' otherwise]:
+
+        'thread'
+          In the Crawler's thread pool, at most ``thread_count``
+          [Default: Crawler.max_workers] at once.
+        'async'
+          On one asyncio event loop, at most ``concurrency``
+          [Default: DEFAULT_ASYNC_CONCURRENCY] at once.
+        'process'
+          In a pool of ``thread_count`` [Default: number of CPUs] worker
+          processes, for CPU bound payloads.  ``payload`` and its arguments
+          must be picklable.  Each process receives a CrawlerProcessAccount
+          copy of the account rather than the OrgAccount itself.
+
+        In all modes at most Crawler.max_per_account payloads run at once in
+        one account and at most Crawler.max_per_region in one region.
+        """
+        execution = CrawlerExecution(payload)
+        for response in self._iter_execution(execution, args, kwargs, mode, thread_count,
+                concurrency, keep_responses=True):
+            pass
+        if execution.errors > 0:
+            execution.handle_errors()
+        return execution
+
+    def execute_iter(self, payload, *args, mode=None, thread_count=None, concurrency=None,
+            keep_responses=False, **kwargs):
+        """
+        Generator version of ``execute()``.  Yields each CrawlerResponse as
+        soon as its payload finishes, in completion order.  Payload errors
+        are not raised; check ``response.exc_info``.
+
+        The CrawlerExecution is added to Crawler.executions when iteration
+        starts.  Its ``errors`` count and timer are kept up to date, but
+        responses are only stored on it if ``keep_responses`` is True, so by
+        default a consumer can process any number of responses in constant
+        memory.  Closing the generator early stops payloads that have not yet
+        started.
+        """
+        execution = CrawlerExecution(payload)
+        yield from self._iter_execution(execution, args, kwargs, mode, thread_count,
+            concurrency, keep_responses)
+
+    def _iter_execution(self, execution, args, kwargs, mode, thread_count, concurrency,
+            keep_responses):
+        if mode is None:
+            mode = 'async' if inspect.iscoroutinefunction(execution.payload) else 'thread'
+        if mode not in EXECUTION_MODES:
+            raise ValueError('mode must be one of: {}'.format(', '.join(EXECUTION_MODES)))
+        if mode == 'async':
+            engine, limit = self._execute_async, concurrency
+        elif mode == 'process':
+            engine, limit = self._execute_in_processes, thread_count
+        else:
+            engine, limit = self._execute_threaded, thread_count
+        accounts_and_regions = [
+            (account, region) for region in self.regions for account in self.accounts
+        ]
+        completed = queue.Queue(maxsize=RESPONSE_QUEUE_SIZE)
+        cancel_event = threading.Event()
+        finished = object()
+        engine_error = []
+
+        def run_engine():
+            try:
+                engine(execution, accounts_and_regions, args, kwargs, limit,
+                    completed.put, cancel_event)
+            except Exception:   # pragma: no cover
+                engine_error.append(sys.exc_info())
+            completed.put(finished)
 
-        def run_payload_in_account(account_region_map, execution, args, kwargs):
-            region = account_region_map['region']
-            account = account_region_map['account']
+        self.executions.append(execution)
+        execution.timer.start()
+        runner = threading.Thread(target=run_engine, daemon=True)
+        runner.start()
+        try:
+            while True:
+                response = completed.get()
+                if response is finished:
+                    break
+                if response.exc_info:
+                    execution.errors += 1
+                if keep_responses:
+                    execution.responses.append(response)
+                yield response
+        finally:
+            cancel_event.set()
+            # keep draining so the engine is never blocked on a full queue
+            while runner.is_alive():
+                try:
+                    completed.get(timeout=0.1)
+                except queue.Empty:
+                    pass
+            execution.timer.stop()
+        if engine_error:    # pragma: no cover
+            raise engine_error[0][1].with_traceback(engine_error[0][2])
+
+    def _execute_threaded(self, execution, accounts_and_regions, args, kwargs, thread_count,
+            deliver, cancel_event):
+
+        def run_payload_in_account(account_region, execution, args, kwargs):
+            account, region = account_region
             response = CrawlerResponse(region, account)
             response.timer.start()
             try:
                 response.payload_output = execution.payload(region, account, *args, **kwargs)
             except Exception:
                 response.exc_info = sys.exc_info()
-                execution.errors += 1
             response.timer.stop()
-            execution.responses.append(response)
+            deliver(response)
 
-        accounts_and_regions = []
-        for region in self.regions:
-            for account in self.accounts:
-                accounts_and_regions.append(dict(account=account, region=region))
-        thread_count = kwargs.get('thread_count', len(self.accounts))
-        execution = CrawlerExecution(payload)
-        execution.timer.start()
-        utils.queue_threads(
+        scheduler = CrawlerScheduler(
+            self._get_worker_pool(thread_count),
+            max_per_account=self.max_per_account,
+            max_per_region=self.max_per_region,
+        )
+        scheduler.run(
             accounts_and_regions,
             run_payload_in_account,
             func_args=(execution, args, kwargs),
-            thread_count=thread_count,
+            cancel_event=cancel_event,
+        )
+
+    def _execute_async(self, execution, accounts_and_regions, args, kwargs, concurrency,
+            deliver, cancel_event):
+
+        async def run_all_payloads():
+            semaphore = asyncio.Semaphore(concurrency or DEFAULT_ASYNC_CONCURRENCY)
+            account_semaphores = dict()
+            region_semaphores = dict()
+
+            def limiter(semaphores, key, limit):
+                if limit is None:
+                    return None
+                if key not in semaphores:
+                    semaphores[key] = asyncio.Semaphore(limit)
+                return semaphores[key]
+
+            async def run_payload_in_account(account, region):
+                # take the per account and region slots before the global one
+                # so waiting on a busy account does not hold up other accounts
+                limiters = [sem for sem in (
+                    limiter(account_semaphores, account.id, self.max_per_account),
+                    limiter(region_semaphores, region, self.max_per_region),
+                    semaphore,
+                ) if sem is not None]
+                for sem in limiters:
+                    await sem.acquire()
+                response = CrawlerResponse(region, account)
+                response.timer.start()
+                try:
+                    if cancel_event.is_set():
+                        return
+                    response.payload_output = await execution.payload(
+                        region, account, *args, **kwargs
+                    )
+                except Exception:
+                    response.exc_info = sys.exc_info()
+                finally:
+                    for sem in limiters:
+                        sem.release()
+                response.timer.stop()
+                deliver(response)
+
+            await asyncio.gather(*[
+                run_payload_in_account(account, region)
+                for account, region in accounts_and_regions
+            ])
+
+        loop = asyncio.new_event_loop()
+        try:
+            loop.run_until_complete(run_all_payloads())
+        finally:
+            loop.close()
+
+    def _get_process_pool(self, process_count=None):
+        """
+        Return the Crawler's process pool, which is kept and reused across
+        calls as long as ``process_count`` does not change.
+        """
+        process_count = max(1, process_count or os.cpu_count() or 1)
+        if self._process_pool is None or self._process_count != process_count:
+            if self._process_pool is not None:
+                self._process_pool.shutdown(wait=False)
+            self._process_pool = ProcessPoolExecutor(max_workers=process_count)
+            self._process_count = process_count
+        return self._process_pool
+
+    def _execute_in_processes(self, execution, accounts_and_regions, args, kwargs,
+            process_count, deliver, cancel_event):
+
+        def run_payload_in_process(account_region, execution, process_pool, args, kwargs):
+            account, region = account_region
+            response = CrawlerResponse(region, account)
+            future = process_pool.submit(
+                run_payload_in_process_worker,
+                execution.payload,
+                region,
+                CrawlerProcessAccount(account),
+                args,
+                kwargs,
+            )
+            try:
+                result = future.result()
+            except Exception:
+                # the task itself could not be sent or run, e.g. unpicklable payload
+                response.exc_info = sys.exc_info()
+            else:
+                response.payload_output = result['payload_output']
+                response.timer.start_time = result['statistics']['start_time']
+                response.timer.end_time = result['statistics']['end_time']
+                response.timer.elapsed_time = result['statistics']['elapsed_time']
+                if result['exception'] is not None:
+                    exception = result['exception']
+                    exception.__cause__ = CrawlerRemoteTraceback(result['traceback'])
+                    response.exc_info = (type(exception), exception, None)
+            deliver(response)
+
+        process_pool = self._get_process_pool(process_count)
+        scheduler = CrawlerScheduler(
+            self._get_worker_pool(self._process_count),
+            max_per_account=self.max_per_account,
+            max_per_region=self.max_per_region,
+        )
+        scheduler.run(
+            accounts_and_regions,
+            run_payload_in_process,
+            func_args=(execution, process_pool, args, kwargs),
+            cancel_event=cancel_event,
         )
-        execution.timer.stop()
-        self.executions.append(execution)
-        if execution.errors > 0:
-            execution.handle_errors()
-        return execution
 
     def get_execution(self, name):
         return next((r for r in self.executions if r.name == name), None)
 
+    def close(self):
+        """
+        Shut down the Crawler's thread and process pools.  They are recreated
+        if the Crawler is used again.
+        """
+        if self._worker_pool is not None:
+            self._worker_pool.shutdown()
+            self._worker_pool = None
+        if self._process_pool is not None:
+            self._process_pool.shutdown()
+            self._process_pool = None
+
+
+class CrawlerProcessAccount(object):
+    """
+    Picklable copy of an OrgAccount's attributes and credentials, passed to
+    payloads run in ``mode='process'``.
+    """
+
+    def __init__(self, account):
+        self.__dict__.update(account.dump())
+        self.credentials = dict(account.credentials)
+
+    def dump(self):
+        account_dump = dict(vars(self))
+        account_dump.update(dict(credentials={}))
+        return account_dump
+
+
+class CrawlerRemoteTraceback(Exception):
+    """
+    Carries the formatted traceback of a payload exception raised in a
+    worker process.  Set as the ``__cause__`` of that exception.
+    """
+
+    def __init__(self, tb):
+        self.tb = tb
+
+    def __str__(self):
+        return self.tb
+
+
+def run_payload_in_process_worker(payload, region, account, args, kwargs):
+    """
+    Run one payload in a worker process.  Returns the payload output, timer
+    statistics and any exception in picklable form.
+    """
+    timer = CrawlerTimer()
+    result = dict(payload_output=None, exception=None, traceback=None)
+    timer.start()
+    try:
+        result['payload_output'] = payload(region, account, *args, **kwargs)
+    except Exception as e:
+        result['traceback'] = traceback.format_exc()
+        try:
+            pickle.dumps(e)
+            result['exception'] = e
+        except Exception:
+            result['exception'] = RuntimeError(repr(e))
+    timer.stop()
+    result['statistics'] = timer.dump()
+    return result
+
+
+class CrawlerScheduler(object):
+    """
+    Feeds (account, region) tasks to a WorkerPool, keeping at most
+    ``pool.max_workers`` tasks in flight, at most ``max_per_account`` of them
+    for any one account and at most ``max_per_region`` for any one region.
+    Tasks are started in list order, skipping over those whose account or
+    region is at its limit.
+    """
+
+    def __init__(self, pool, max_per_account=None, max_per_region=None):
+        self.pool = pool
+        self.max_per_account = max_per_account
+        self.max_per_region = max_per_region
+        self._condition = threading.Condition()
+        self._running_by_account = Counter()
+        self._running_by_region = Counter()
+        self._in_flight = 0
+
+    def _is_runnable(self, task):
+        account, region = task
+        if self.max_per_account is not None:
+            if self._running_by_account[account.id] >= self.max_per_account:
+                return False
+        if self.max_per_region is not None:
+            if self._running_by_region[region] >= self.max_per_region:
+                return False
+        return True
+
+    def _take_next_runnable(self, pending):
+        if self.max_per_account is None and self.max_per_region is None:
+            return pending.popleft()
+        for position, task in enumerate(pending):
+            if self._is_runnable(task):
+                del pending[position]
+                return task
+        return None
+
+    def _run_task(self, task, func, func_args):
+        account, region = task
+        try:
+            func(task, *func_args)
+        finally:
+            with self._condition:
+                self._running_by_account[account.id] -= 1
+                self._running_by_region[region] -= 1
+                self._in_flight -= 1
+                self._condition.notify()
+
+    def run(self, tasks, func, func_args=(), cancel_event=None):
+        """
+        Run ``func((account, region), *func_args)`` for every task and wait
+        for all of them.  ``func`` is expected to handle its own exceptions.
+        Once ``cancel_event`` is set no further tasks are started.
+        """
+        pending = deque(tasks)
+        with self._condition:
+            while pending or self._in_flight:
+                if cancel_event is not None and cancel_event.is_set():
+                    pending.clear()
+                task = None
+                if pending and self._in_flight < self.pool.max_workers:
+                    task = self._take_next_runnable(pending)
+                if task is None:
+                    self._condition.wait()
+                    continue
+                account, region = task
+                self._running_by_account[account.id] += 1
+                self._running_by_region[region] += 1
+                self._in_flight += 1
+                self.pool.submit(self._run_task, task, func, func_args)
+
 
 class CrawlerTimer(object):
 
@@ -3,6 +3,15 @@ import logging
 from datetime import datetime, date
 
 
+_LEVELS = dict(
+    debug=logging.DEBUG,
+    info=logging.INFO,
+    warning=logging.WARNING,
+    error=logging.ERROR,
+    critical=logging.CRITICAL,
+)
+
+
 class DateTimeEncoder(json.JSONEncoder):
     def default(self, o):
         if isinstance(o, (datetime, date)):
@@ -36,35 +45,46 @@ class Logger(object):
         Args:
         message (str): log message, can be a dict, list, string, or json blob
         """
-        try:
-            message = json.loads(message)
-        except Exception:
-            pass
+        if isinstance(message, (str, bytes)):
+            try:
+                message = json.loads(message)
+            except Exception:
+                pass
         try:
             return json.dumps(message, indent=4, cls=DateTimeEncoder)
         except Exception:
             return json.dumps(str(message))
 
+    def is_enabled_for(self, level):
+        """True if messages at ``level`` (e.g. 'info') would be emitted"""
+        return self.log.isEnabledFor(_LEVELS[level])
+
+    def _log(self, level, message, **kwargs):
+        # check the level before paying for json formatting
+        if self.log.isEnabledFor(level):
+            self.log.log(level, self._format(message), **kwargs)
+
     def debug(self, message, **kwargs):
         """wrapper for logging.debug call"""
-        self.log.debug(self._format(message), **kwargs)
+        self._log(logging.DEBUG, message, **kwargs)
 
     def info(self, message, **kwargs):
         """wrapper for logging.info call"""
-        self.log.info(self._format(message), **kwargs)
+        self._log(logging.INFO, message, **kwargs)
 
     def warning(self, message, **kwargs):
         """wrapper for logging.warning call"""
-        self.log.warning(self._format(message), **kwargs)
+        self._log(logging.WARNING, message, **kwargs)
 
     def error(self, message, **kwargs):
         """wrapper for logging.error call"""
-        self.log.error(self._format(message), **kwargs)
+        self._log(logging.ERROR, message, **kwargs)
 
     def critical(self, message, **kwargs):
         """wrapper for logging.critical call"""
-        self.log.critical(self._format(message), **kwargs)
+        self._log(logging.CRITICAL, message, **kwargs)
 
     def exception(self, message, **kwargs):
         """wrapper for logging.exception call"""
-        self.log.exception(self._format(message), **kwargs)
+        kwargs.setdefault('exc_info', True)
+        self._log(logging.ERROR, message, **kwargs)
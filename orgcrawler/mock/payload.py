@@ -76,3 +76,16 @@ def mixed_params(region, account, arg1, arg2, arg3, kwarg1='default1', kwarg2='d
         kwarg2=kwarg2,
         kwarg3=kwarg3,
     ))
+
+
+async def async_params(region, account, arg1, arg2, arg3, kwarg1='default1'):
+    return dict(params=dict(
+        arg1=arg1,
+        arg2=arg2,
+        arg3=arg3,
+        kwarg1=kwarg1,
+    ))
+
+
+async def async_bad_payload_func(region, account):
+    raise RuntimeError('async payload failed in {}'.format(region))
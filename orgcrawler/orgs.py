@@ -1,9 +1,9 @@
 import os
 import sys
 import shutil
-import inspect
 import pickle
 import json
+from bisect import bisect_left, bisect_right
 from datetime import datetime, timedelta
 
 import boto3
@@ -38,6 +38,18 @@ class Org(object):
             [Default: ``~/.aws/orgcrawler-cache``].
         cache_file (str): Cache file name
             [Default: ``cache_file-${master_account_id}``].
+        account_parents_by_ou (bool): Set account parent ids from one
+            ``list_accounts_for_parent`` call per org_unit during the OU walk
+            rather than one ``list_parents`` call per account [Default: False].
+        policy_ids_from_targets (bool): Set ``attached_policy_ids`` on accounts
+            and org_units by inverting the policy target lists rather than
+            with one ``list_policies_for_target`` call per account and
+            org_unit [Default: False].
+        pipelined_load (bool): Load accounts, org_units and policies at the
+            same time rather than one after the other [Default: False].
+        thread_count (int): Number of threads making API calls during load.
+            When ``pipelined_load`` is set, this is shared by all three
+            resource types [Default: ``utils.DEFAULT_THREAD_COUNT``].
 
     Object Attributes and Methods:
 
@@ -61,7 +73,11 @@ class Org(object):
             log_level=utils.DEFAULT_LOGLEVEL,
             cache_file_max_age=60,
             cache_dir='~/.aws/orgcrawler-cache',
-            cache_file=None):
+            cache_file=None,
+            account_parents_by_ou=False,
+            policy_ids_from_targets=False,
+            pipelined_load=False,
+            thread_count=utils.DEFAULT_THREAD_COUNT):
         self.master_account_id = master_account_id
         self.access_role = org_access_role
         self.logger = Logger(loglevel=log_level)
@@ -76,7 +92,14 @@ class Org(object):
         if cache_file is None:
             cache_file = '-'.join(['cache_file', master_account_id])
         self._cache_file = os.path.join(self._cache_dir, cache_file)
-        self._exc_info = None
+        self._index = None
+        self._indexed_lists = None
+        self._account_parents_by_ou = account_parents_by_ou
+        self._account_parent_ids = dict()
+        self._policy_ids_from_targets = policy_ids_from_targets
+        self._pipelined_load = pipelined_load
+        self._thread_count = thread_count
+        self._worker_pool = None
 
     def dump_accounts(self, account_list=None):
         """
@@ -109,6 +132,14 @@ class Org(object):
         org_dump.pop('_cache_dir')
         org_dump.pop('_cache_file')
         org_dump.pop('_cache_file_max_age')
+        org_dump.pop('_index')
+        org_dump.pop('_indexed_lists')
+        org_dump.pop('_account_parents_by_ou')
+        org_dump.pop('_account_parent_ids')
+        org_dump.pop('_policy_ids_from_targets')
+        org_dump.pop('_pipelined_load')
+        org_dump.pop('_thread_count')
+        org_dump.pop('_worker_pool')
         org_dump['accounts'] = self.dump_accounts()
         org_dump['org_units'] = self.dump_org_units()
         org_dump['policies'] = self.dump_policies()
@@ -128,7 +159,7 @@ class Org(object):
         message = {
             'FILE': __file__.split('/')[-1],
             'CLASS': self.__class__.__name__,
-            'METHOD': inspect.stack()[0][3],
+            'METHOD': 'load',
         }
         self.logger.info(message)
         self._load_client()
@@ -137,13 +168,60 @@ class Org(object):
             self._load_org_dump(org_dump)
         except RuntimeError:
             self._load_org()
-            self.accounts = []
-            self._load_accounts()
-            self.org_units = []
-            self._load_org_units()
-            self.policies = []
-            self._load_policies()
+            self._account_parent_ids = dict()
+            if self._pipelined_load:
+                self._load_resources_pipelined()
+            else:
+                self.accounts = []
+                self._load_accounts()
+                self.org_units = []
+                self._load_org_units()
+                self.policies = []
+                self._load_policies()
             self._save_cached_org_to_file()
+        self._build_indexes()
+
+    def _load_resources_pipelined(self):
+        """
+        Load accounts, org_units and policies at the same time.  Each load
+        runs in its own thread but hands its API calls to the Org's worker
+        pool of ``thread_count`` threads, so the three loads overlap without
+        raising the overall number of concurrent API calls.
+        """
+        message = {
+            'FILE': __file__.split('/')[-1],
+            'CLASS': self.__class__.__name__,
+            'METHOD': '_load_resources_pipelined',
+        }
+        self.logger.info(message)
+        self.accounts = []
+        self.org_units = []
+        self.policies = []
+        phase_pool = utils.WorkerPool(max_workers=3, name='orgcrawler-load')
+        try:
+            results = phase_pool.map(
+                lambda phase: phase(),
+                [self._load_accounts, self._load_org_units, self._load_policies],
+            )
+        finally:
+            phase_pool.shutdown()
+        for result in results:
+            result.reraise()
+        if self._account_parents_by_ou:
+            self._set_account_parent_ids()
+        if self._policy_ids_from_targets:
+            self._set_attached_policy_ids()
+
+    def _run_tasks(self, sequence, func, func_args=()):
+        """
+        Run ``func(item, *func_args)`` for each item in ``sequence`` in the
+        Org's worker pool and wait for all to finish.  The first exception
+        raised by any item is re-raised here.
+        """
+        if self._worker_pool is None:
+            self._worker_pool = utils.WorkerPool(max_workers=self._thread_count)
+        for result in self._worker_pool.map(func, sequence, func_args=func_args):
+            result.reraise()
 
     def clear_cache(self):
         '''
@@ -156,7 +234,7 @@ class Org(object):
         message = {
             'FILE': __file__.split('/')[-1],
             'CLASS': self.__class__.__name__,
-            'METHOD': inspect.stack()[0][3],
+            'METHOD': '_load_client',
         }
         self.logger.info(message)
         self.client = self._get_org_client()
@@ -166,7 +244,7 @@ class Org(object):
         message = {
             'FILE': __file__.split('/')[-1],
             'CLASS': self.__class__.__name__,
-            'METHOD': inspect.stack()[0][3],
+            'METHOD': '_get_org_client',
         }
         self.logger.info(message)
         try:
@@ -192,7 +270,7 @@ class Org(object):
         message = {
             'FILE': __file__.split('/')[-1],
             'CLASS': self.__class__.__name__,
-            'METHOD': inspect.stack()[0][3],
+            'METHOD': '_get_cached_org_from_file',
         }
         self.logger.info(message)
         if not os.path.isfile(self._cache_file):
@@ -209,7 +287,7 @@ class Org(object):
         message = {
             'FILE': __file__.split('/')[-1],
             'CLASS': self.__class__.__name__,
-            'METHOD': inspect.stack()[0][3],
+            'METHOD': '_load_org_dump',
         }
         self.logger.info(message)
         self.id = org_dump['id']
@@ -223,12 +301,13 @@ class Org(object):
         self.policies = [
             OrgPolicy(self, **policy) for policy in org_dump['policies']
         ]
+        self._build_indexes()
 
     def _load_org(self):
         message = {
             'FILE': __file__.split('/')[-1],
             'CLASS': self.__class__.__name__,
-            'METHOD': inspect.stack()[0][3],
+            'METHOD': '_load_org',
         }
         self.logger.info(message)
         response = self.client.describe_organization()
@@ -239,7 +318,7 @@ class Org(object):
         message = {
             'FILE': __file__.split('/')[-1],
             'CLASS': self.__class__.__name__,
-            'METHOD': inspect.stack()[0][3],
+            'METHOD': '_load_accounts',
         }
         self.logger.info(message)
         accounts = utils.handle_nexttoken_and_retries(
@@ -254,71 +333,119 @@ class Org(object):
             message = {
                 'FILE': __file__.split('/')[-1],
                 'CLASS': self.__class__.__name__,
-                'METHOD': inspect.stack()[0][3],
+                'METHOD': 'make_org_account_object',
                 'account_id': account['Id'],
                 'account_name': account['Name'],
             }
             self.logger.info(message)
-            try:
-                org_account = OrgAccount(
-                    org,
-                    name=account['Name'],
-                    id=account['Id'],
-                    email=account['Email'],
-                )
+            org_account = OrgAccount(
+                org,
+                name=account['Name'],
+                id=account['Id'],
+                email=account['Email'],
+            )
+            if not org._account_parents_by_ou:
                 org_account.get_parent_id()
+            if not org._policy_ids_from_targets:
                 org_account.load_attached_policy_ids()
-                org.accounts.append(org_account)
-            except Exception:   # pragma: no cover
-                org._exc_info = sys.exc_info()
-
-        utils.queue_threads(
-            accounts,
-            make_org_account_object,
-            func_args=(self,),
-            logger=self.logger,
-        )
-        if self._exc_info:   # pragma: no cover
-            raise self._exc_info[1].with_traceback(self._exc_info[2])
+            org.accounts.append(org_account)
+        self._run_tasks(accounts, make_org_account_object, func_args=(self,))
+        if self._account_parents_by_ou:
+            self._set_account_parent_ids()
+        if self._policy_ids_from_targets:
+            self._set_attached_policy_ids()
 
     def _load_org_units(self):
         message = {
             'FILE': __file__.split('/')[-1],
             'CLASS': self.__class__.__name__,
-            'METHOD': inspect.stack()[0][3],
+            'METHOD': '_load_org_units',
         }
         self.logger.info(message)
         self._recurse_organization(self.root_id)
+        if self._account_parents_by_ou:
+            self._set_account_parent_ids()
+        if self._policy_ids_from_targets:
+            self._set_attached_policy_ids()
+
+    def _set_account_parent_ids(self):
+        """
+        Set parent_id on loaded accounts from the account listings gathered
+        during the OU walk.  Called after both accounts and org_units are
+        loaded, whichever finishes last.
+        """
+        for account in self.accounts:
+            parent_id = self._account_parent_ids.get(account.id)
+            if parent_id is not None:
+                account.parent_id = parent_id
+
+    def _set_attached_policy_ids(self):
+        """
+        Set attached_policy_ids on loaded accounts and org_units from the
+        targets of loaded policies.  Called at the end of each of the account,
+        org_unit and policy loads, so the last one to finish fills in all.
+        """
+        policy_ids_by_target = dict()
+        for policy in self.policies:
+            for target in policy.targets:
+                policy_ids_by_target.setdefault(target['TargetId'], []).append(policy.id)
+        for org_object in self.accounts + self.org_units:
+            org_object.attached_policy_ids = policy_ids_by_target.get(org_object.id, [])
 
     def _recurse_organization(self, parent_id):
+        """
+        Load all org_units below ``parent_id``.  The tree is walked breadth
+        first.  All org_units in one level of the tree are handled in the
+        thread pool at once, so load time scales with tree depth rather than
+        with the number of org_units.  With ``account_parents_by_ou`` set, the
+        accounts directly under each org_unit are recorded on the way.
+        """
         message = {
             'FILE': __file__.split('/')[-1],
             'CLASS': self.__class__.__name__,
-            'METHOD': inspect.stack()[0][3],
+            'METHOD': '_recurse_organization',
         }
         self.logger.info(message)
-        org_units = utils.handle_nexttoken_and_retries(
-            obj=self,
-            collector_key='OrganizationalUnits',
-            function=self.client.list_organizational_units_for_parent,
-            kwargs=dict(ParentId=parent_id),
-        )
-        for ou in org_units:
-            org_unit = OrganizationalUnit(
-                self,
-                name=ou['Name'],
-                id=ou['Id'],
-                parent_id=parent_id,
+
+        def load_org_unit_and_children(item, org, next_level):
+            ou_id, org_unit = item
+            if org_unit is not None:
+                if not org._policy_ids_from_targets:
+                    org_unit.load_attached_policy_ids()
+                org.org_units.append(org_unit)
+            if org._account_parents_by_ou:
+                accounts = utils.handle_nexttoken_and_retries(
+                    obj=org,
+                    collector_key='Accounts',
+                    function=org.client.list_accounts_for_parent,
+                    kwargs=dict(ParentId=ou_id),
+                )
+                for account in accounts:
+                    org._account_parent_ids[account['Id']] = ou_id
+            children = utils.handle_nexttoken_and_retries(
+                obj=org,
+                collector_key='OrganizationalUnits',
+                function=org.client.list_organizational_units_for_parent,
+                kwargs=dict(ParentId=ou_id),
             )
-            org_unit.load_attached_policy_ids()
-            self.org_units.append(org_unit)
-            self._recurse_organization(ou['Id'])
+            for ou in children:
+                next_level.append((ou['Id'], OrganizationalUnit(
+                    org,
+                    name=ou['Name'],
+                    id=ou['Id'],
+                    parent_id=ou_id,
+                )))
+        level = [(parent_id, None)]
+        while level:
+            next_level = []
+            self._run_tasks(level, load_org_unit_and_children, func_args=(self, next_level))
+            level = next_level
 
     def _load_policies(self):
         message = {
             'FILE': __file__.split('/')[-1],
             'CLASS': self.__class__.__name__,
-            'METHOD': inspect.stack()[0][3],
+            'METHOD': '_load_policies',
         }
         self.logger.info(message)
         policies = utils.handle_nexttoken_and_retries(
@@ -332,41 +459,122 @@ class Org(object):
             message = {
                 'FILE': __file__.split('/')[-1],
                 'CLASS': self.__class__.__name__,
-                'METHOD': inspect.stack()[0][3],
+                'METHOD': 'make_org_policy_object',
                 'policy': policy,
             }
             self.logger.info(message)
-            try:
-                org_policy = OrgPolicy(
-                    org,
-                    name=policy['Name'],
-                    id=policy['Id'],
-                )
-                org_policy.load_targets()
-                org.policies.append(org_policy)
-            except Exception:   # pragma: no cover
-                org._exc_info = sys.exc_info()
-
-        utils.queue_threads(
-            policies,
-            make_org_policy_object,
-            func_args=(self,),
-            logger=self.logger,
-        )
-        if self._exc_info:   # pragma: no cover
-            raise self._exc_info[1].with_traceback(self._exc_info[2])
+            org_policy = OrgPolicy(
+                org,
+                name=policy['Name'],
+                id=policy['Id'],
+            )
+            org_policy.load_targets()
+            org.policies.append(org_policy)
+        self._run_tasks(policies, make_org_policy_object, func_args=(self,))
+        if self._policy_ids_from_targets:
+            self._set_attached_policy_ids()
 
     def _save_cached_org_to_file(self):
         message = {
             'FILE': __file__.split('/')[-1],
             'CLASS': self.__class__.__name__,
-            'METHOD': inspect.stack()[0][3],
+            'METHOD': '_save_cached_org_to_file',
         }
         self.logger.info(message)
         os.makedirs(self._cache_dir, 0o700, exist_ok=True)
         with open(self._cache_file, 'wb') as pf:
             pickle.dump(self.dump(), pf)
 
+    def _build_indexes(self):
+        """
+        Build id, name and alias lookup tables for accounts, org_units and
+        policies.  Where names collide the first object in list order wins,
+        same as a linear search would.  Also map each parent_id to its child
+        accounts and org_units, and number the OU tree (see _number_ou_tree).
+        """
+        index = dict(
+            account_by_id=dict(),
+            account_by_name=dict(),
+            account_by_alias=dict(),
+            org_unit_by_id=dict(),
+            org_unit_by_name=dict(),
+            policy_by_id=dict(),
+            policy_by_name=dict(),
+            accounts_by_parent=dict(),
+            org_units_by_parent=dict(),
+        )
+        for account in self.accounts:
+            index['accounts_by_parent'].setdefault(account.parent_id, []).append(account)
+            index['account_by_id'].setdefault(account.id, account)
+            index['account_by_name'].setdefault(account.name, account)
+            for alias in account.aliases:
+                index['account_by_alias'].setdefault(alias, account)
+        for org_unit in self.org_units:
+            index['org_units_by_parent'].setdefault(org_unit.parent_id, []).append(org_unit)
+            index['org_unit_by_id'].setdefault(org_unit.id, org_unit)
+            index['org_unit_by_name'].setdefault(org_unit.name, org_unit)
+        for policy in self.policies:
+            index['policy_by_id'].setdefault(policy.id, policy)
+            index['policy_by_name'].setdefault(policy.name, policy)
+        self._number_ou_tree(index)
+        self._index = index
+        self._indexed_lists = [
+            (obj_list, len(obj_list))
+            for obj_list in (self.accounts, self.org_units, self.policies)
+        ]
+
+    def _number_ou_tree(self, index):
+        """
+        Give each OU a pre-order entry number, starting with the root at 0,
+        and an exit number equal to the highest entry number in its subtree.
+        An OU's descendants are then exactly the OUs whose entry number falls
+        in (entry, exit], and its accounts (direct or nested) are those whose
+        parent's entry number falls in [entry, exit].  OUs not reachable from
+        the root are left unnumbered.
+        """
+        ou_interval = dict()
+        org_units_in_preorder = []
+        org_units_by_parent = index['org_units_by_parent']
+        if self.root_id is not None:
+            ou_interval[self.root_id] = [0, 0]
+            stack = [(self.root_id, iter(org_units_by_parent.get(self.root_id, [])))]
+            while stack:
+                parent_id, children = stack[-1]
+                org_unit = next(children, None)
+                if org_unit is None:
+                    stack.pop()
+                    ou_interval[parent_id][1] = len(org_units_in_preorder)
+                elif org_unit.id not in ou_interval:
+                    org_units_in_preorder.append(org_unit)
+                    ou_interval[org_unit.id] = [len(org_units_in_preorder), None]
+                    stack.append((
+                        org_unit.id, iter(org_units_by_parent.get(org_unit.id, []))
+                    ))
+        accounts_in_preorder = sorted(
+            (a for a in self.accounts if a.parent_id in ou_interval),
+            key=lambda a: ou_interval[a.parent_id][0],
+        )
+        index['ou_interval'] = {k: tuple(v) for k, v in ou_interval.items()}
+        index['org_units_in_preorder'] = org_units_in_preorder
+        index['accounts_in_preorder'] = accounts_in_preorder
+        index['account_preorder_keys'] = [
+            ou_interval[a.parent_id][0] for a in accounts_in_preorder
+        ]
+
+    def _get_index(self, name):
+        """
+        Return lookup table ``name``, rebuilding all tables first if any of
+        the accounts, org_units or policies lists were replaced or resized
+        since they were last indexed.
+        """
+        current_lists = (self.accounts, self.org_units, self.policies)
+        if self._indexed_lists is None or any(
+            indexed is not current or size != len(current)
+            for (indexed, size), current in zip(self._indexed_lists, current_lists)
+        ):
+            self._build_indexes()
+        return self._index[name]
+
     # Query methods
 
     def list_accounts_by_name(self, account_list=None):
@@ -398,7 +606,10 @@ class Org(object):
         Returns:
             str: account Id matching ``name``
         """
-        return next((a.id for a in self.accounts if a.name == name), None)
+        account = self._get_index('account_by_name').get(name)
+        if account is not None:
+            return account.id
+        return None
 
     def get_account_name_by_id(self, account_id):
         """
@@ -407,7 +618,10 @@ class Org(object):
         Returns:
             str: account name matching ``id``
         """
-        return next((a.name for a in self.accounts if a.id == account_id), None)
+        account = self._get_index('account_by_id').get(account_id)
+        if account is not None:
+            return account.name
+        return None
 
     def get_account(self, identifier):
         """
@@ -418,10 +632,13 @@ class Org(object):
         """
         if isinstance(identifier, OrgAccount):
             return identifier
-        return next((
-            a for a in self.accounts
-            if (identifier == a.name or identifier == a.id or identifier in a.aliases)
-        ), None)
+        if not isinstance(identifier, str):
+            return None
+        for index_name in ('account_by_id', 'account_by_name', 'account_by_alias'):
+            account = self._get_index(index_name).get(identifier)
+            if account is not None:
+                return account
+        return None
 
     def list_org_units_by_name(self, ou_list=None):
         """
@@ -454,10 +671,12 @@ class Org(object):
         """
         if isinstance(identifier, OrganizationalUnit):
             return identifier
-        return next((
-            org_unit for org_unit in self.org_units
-            if (identifier == org_unit.name or identifier == org_unit.id)
-        ), None)
+        if not isinstance(identifier, str):
+            return None
+        org_unit = self._get_index('org_unit_by_id').get(identifier)
+        if org_unit is None:
+            org_unit = self._get_index('org_unit_by_name').get(identifier)
+        return org_unit
 
     def get_org_unit_id(self, identifier):
         """
@@ -482,7 +701,7 @@ class Org(object):
             list(OrganizationalUnit): org_units for which ``ou`` is a direct parent
         """
         ou_id = self.get_org_unit_id(ou)
-        return [ou for ou in self.org_units if ou.parent_id == ou_id]
+        return list(self._get_index('org_units_by_parent').get(ou_id, []))
 
     def list_accounts_in_ou(self, ou):
         """
@@ -492,7 +711,7 @@ class Org(object):
             list(OrgAccount): accounts for which ``ou`` is a direct parent
         """
         ou_id = self.get_org_unit_id(ou)
-        return [a for a in self.accounts if a.parent_id == ou_id]
+        return list(self._get_index('accounts_by_parent').get(ou_id, []))
 
     def list_org_units_in_ou_recursive(self, ou):
         """
@@ -501,10 +720,11 @@ class Org(object):
         Returns:
             list(OrganizationalUnit): org_units for which ``ou`` is an ancestor
         """
-        ou_list = self.list_org_units_in_ou(ou)
-        for ou in ou_list:
-            ou_list += self.list_org_units_in_ou_recursive(ou)
-        return ou_list
+        interval = self._get_index('ou_interval').get(self.get_org_unit_id(ou))
+        if interval is None:
+            return []
+        entry, exit = interval
+        return self._get_index('org_units_in_preorder')[entry:exit]
 
     def list_accounts_in_ou_recursive(self, ou):
         """
@@ -513,10 +733,34 @@ class Org(object):
         Returns:
             list(OrgAccount): accounts for which ``ou`` is an ancestor
         """
-        account_list = self.list_accounts_in_ou(ou)
-        for ou in self.list_org_units_in_ou_recursive(ou):
-            account_list += self.list_accounts_in_ou(ou)
-        return account_list
+        interval = self._get_index('ou_interval').get(self.get_org_unit_id(ou))
+        if interval is None:
+            return []
+        entry, exit = interval
+        keys = self._get_index('account_preorder_keys')
+        return self._get_index('accounts_in_preorder')[
+            bisect_left(keys, entry):bisect_right(keys, exit)
+        ]
+
+    def is_descendant(self, identifier, ou):
+        """
+        Args:
+            identifier (str, OrgObject): account or org_unit name, id or object
+            ou (str, OrganizationalUnit): org_unit name, id or object
+        Returns:
+            bool: True if ``ou`` is an ancestor of ``identifier``
+        """
+        ou_interval = self._get_index('ou_interval')
+        ancestor = ou_interval.get(self.get_org_unit_id(ou))
+        if ancestor is None:
+            return False
+        account = self.get_account(identifier)
+        if account is not None:
+            position = ou_interval.get(account.parent_id)
+            return position is not None and ancestor[0] <= position[0] <= ancestor[1]
+        org_unit_id = self.get_org_unit_id(identifier)
+        position = ou_interval.get(org_unit_id)
+        return position is not None and ancestor[0] < position[0] <= ancestor[1]
 
     def list_policies_by_name(self, policy_list=None):
         """
@@ -549,10 +793,12 @@ class Org(object):
         """
         if isinstance(identifier, OrgPolicy):
             return identifier
-        return next((
-            p for p in self.policies
-            if (identifier == p.name or identifier == p.id)
-        ), None)
+        if not isinstance(identifier, str):
+            return None
+        policy = self._get_index('policy_by_id').get(identifier)
+        if policy is None:
+            policy = self._get_index('policy_by_name').get(identifier)
+        return policy
 
     def get_policy_id(self, identifier):
         """
@@ -573,7 +819,10 @@ class Org(object):
         Returns:
             str: policy Id matching ``name``
         """
-        return next((p.id for p in self.policies if p.name == name), None)
+        policy = self._get_index('policy_by_name').get(name)
+        if policy is not None:
+            return policy.id
+        return None
 
     def get_policy_name_by_id(self, policy_id):
         """
@@ -582,7 +831,10 @@ class Org(object):
         Returns:
             str: policy name matching ``id``
         """
-        return next((p.name for p in self.policies if p.id == policy_id), None)
+        policy = self._get_index('policy_by_id').get(policy_id)
+        if policy is not None:
+            return policy.name
+        return None
 
     '''
     def get_policy_document(self, identifier):
@@ -682,7 +934,7 @@ class OrgObject(object):
         message = {
             'FILE': __file__.split('/')[-1],
             'CLASS': self.__class__.__name__,
-            'METHOD': inspect.stack()[0][3],
+            'METHOD': 'get_parent_id',
             'object_id': self.id,
             'object_name': self.name,
         }
@@ -701,7 +953,7 @@ class OrgObject(object):
         message = {
             'FILE': __file__.split('/')[-1],
             'CLASS': self.__class__.__name__,
-            'METHOD': inspect.stack()[0][3],
+            'METHOD': 'load_attached_policy_ids',
             'object_id': self.id,
             'object_name': self.name,
         }
@@ -751,7 +1003,7 @@ class OrgPolicy(OrgObject):
         message = {
             'FILE': __file__.split('/')[-1],
             'CLASS': self.__class__.__name__,
-            'METHOD': inspect.stack()[0][3],
+            'METHOD': 'load_targets',
             'policy': self.name,
         }
         self.logger.info(message)
@@ -1,15 +1,12 @@
 import sys
 import threading
-try:
-    import queue
-except ImportError:     # pragma: no cover
-    import Queue as queue
 import json
 import yaml
-import inspect
 import time
+import random
 from datetime import datetime
 from functools import singledispatch
+from concurrent.futures import ThreadPoolExecutor, wait
 
 import boto3
 from botocore.exceptions import ClientError
@@ -19,13 +16,14 @@ from orgcrawler.logger import Logger
 
 DEFAULT_LOGLEVEL = 'warning'
 DEFAULT_THREAD_COUNT = 6
+DEFAULT_MAX_RETRY = 8
 
 
 def get_logger(log_level=DEFAULT_LOGLEVEL):
     my_logger = Logger(loglevel=log_level)
     message = {
         'FILE': __file__.split('/')[-1],
-        'FUCNTION': inspect.stack()[0][3],
+        'FUCNTION': 'get_logger',
     }
     my_logger.info(message)
     return my_logger
@@ -109,9 +107,93 @@ def get_master_account_id(role_name=None):
         sys.exit(e)
 
 
+class WorkerResult(object):
+    """
+    Outcome of running one item through a WorkerPool.
+
+    Attributes:
+        item: the item from the input sequence
+        result: return value of the worker function, or None
+        exc_info (tuple): ``sys.exc_info()`` if the function raised, or None
+        cancelled (bool): True if the item was never run
+    """
+
+    def __init__(self, item, result=None, exc_info=None, cancelled=False):
+        self.item = item
+        self.result = result
+        self.exc_info = exc_info
+        self.cancelled = cancelled
+
+    def reraise(self):
+        """Raise the exception captured for this item, if any"""
+        if self.exc_info is not None:
+            raise self.exc_info[1].with_traceback(self.exc_info[2])
+
+
+class WorkerPool(object):
+    """
+    Reusable, bounded pool of worker threads.
+
+    Threads are started on demand up to ``max_workers`` and are kept for
+    reuse by later calls until ``shutdown()``.
+
+    Args:
+        max_workers (int): most threads run at once [Default: DEFAULT_THREAD_COUNT]
+        name (str): thread name prefix
+    """
+
+    def __init__(self, max_workers=DEFAULT_THREAD_COUNT, name='orgcrawler'):
+        self.max_workers = max_workers
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=name)
+
+    def submit(self, func, *args, **kwargs):
+        """Schedule ``func(*args, **kwargs)``.  Returns a concurrent.futures.Future"""
+        return self._executor.submit(func, *args, **kwargs)
+
+    def map(self, func, sequence, func_args=(), cancel_event=None, stop_on_error=False):
+        """
+        Run ``func(item, *func_args)`` for every item in ``sequence`` and wait
+        for all of them.
+
+        Args:
+            func (Function): python code to run within the threads
+            sequence (list): items to iterate over
+            func_args (tuple): optional extra arguments for ``func``
+            cancel_event (threading.Event): once set, items not yet started
+                are skipped
+            stop_on_error (bool): skip items not yet started after the first
+                exception
+        Returns:
+            list(WorkerResult): one result per item, in ``sequence`` order
+        """
+        if cancel_event is None:
+            cancel_event = threading.Event()
+
+        def run_item(item):
+            if cancel_event.is_set():
+                return WorkerResult(item, cancelled=True)
+            try:
+                return WorkerResult(item, result=func(item, *func_args))
+            except Exception:
+                if stop_on_error:
+                    cancel_event.set()
+                return WorkerResult(item, exc_info=sys.exc_info())
+
+        futures = [self._executor.submit(run_item, item) for item in sequence]
+        wait(futures)
+        return [future.result() for future in futures]
+
+    def shutdown(self, wait=True):
+        self._executor.shutdown(wait=wait)
+
+
 def queue_threads(sequence, func, func_args=(), thread_count=DEFAULT_THREAD_COUNT, logger=get_logger()):
     """
-    Generalized abstraction for running queued tasks in a thread pool
+    Generalized abstraction for running queued tasks in a thread pool.
+
+    Runs ``func`` in a throw away WorkerPool and re-raises the first
+    exception.  Code that runs tasks repeatedly should keep a WorkerPool
+    instead.
 
     Args:
         sequence (list): list of items or data structures to iterate over
@@ -122,25 +204,18 @@ def queue_threads(sequence, func, func_args=(), thread_count=DEFAULT_THREAD_COUN
     """
     message = {
         'FILE': __file__.split('/')[-1],
-        'METHOD': inspect.stack()[0][3],
+        'METHOD': 'queue_threads',
         'func': func,
         'func_args': func_args,
     }
     logger.info(message)
-
-    def worker(*args):
-        while not q.empty():
-            item = q.get()
-            func(item, *args)
-            q.task_done()
-    q = queue.Queue()
-    for item in sequence:
-        q.put(item)
-    for i in range(thread_count):
-        t = threading.Thread(target=worker, args=func_args)
-        t.setDaemon(True)
-        t.start()
-    q.join()
+    pool = WorkerPool(max_workers=max(1, thread_count))
+    try:
+        results = pool.map(func, sequence, func_args=func_args)
+    finally:
+        pool.shutdown()
+    for result in results:
+        result.reraise()
 
 
 def regions_for_service(service_name):
@@ -157,20 +232,97 @@ def all_regions():
     return regions_for_service('ec2')
 
 
-def handle_nexttoken_and_retries(obj, collector_key, function, kwargs=dict()):
+class RateLimiter(object):
+    """
+    Thread safe token bucket with additive increase, multiplicative
+    decrease (AIMD) rate control.
+
+    Callers take a token with ``acquire()`` before each API call and report
+    the outcome with ``succeeded()`` or ``throttled()``.  Each success raises
+    the rate by ``increase`` calls/second up to ``max_rate``.  Each throttle
+    multiplies the rate by ``decrease`` down to ``min_rate`` and empties the
+    bucket.  ``backoff()`` sleeps for an exponentially growing, fully
+    jittered delay between retries.
+
+    Args:
+        rate (float): initial calls per second
+        burst (int): bucket size, the most calls allowed back to back
+        min_rate (float): lower bound for rate
+        max_rate (float): upper bound for rate
+        increase (float): calls per second added on each success
+        decrease (float): factor applied to rate on each throttle
+        base_delay (float): first retry backoff ceiling in seconds
+        max_delay (float): retry backoff ceiling in seconds
+    """
+
+    def __init__(self, rate=10.0, burst=10, min_rate=0.5, max_rate=20.0,
+            increase=0.05, decrease=0.5, base_delay=0.25, max_delay=10.0):
+        self.rate = rate
+        self.burst = burst
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.increase = increase
+        self.decrease = decrease
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self._tokens = burst
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Block until a call may be made"""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            # reserve a token now, possibly going into debt, so that waiting
+            # callers are spaced out rather than all waking at once
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0
+        if wait > 0:
+            time.sleep(wait)
+
+    def succeeded(self):
+        with self._lock:
+            self.rate = min(self.max_rate, self.rate + self.increase)
+
+    def throttled(self):
+        with self._lock:
+            self.rate = max(self.min_rate, self.rate * self.decrease)
+            self._tokens = min(self._tokens, 0)
+
+    def backoff(self, retry_count):
+        """Sleep a random time up to base_delay * 2**retry_count, capped at max_delay"""
+        time.sleep(random.uniform(0, min(self.max_delay, self.base_delay * 2 ** retry_count)))
+
+
+# Shared by every thread making AWS Organizations API calls in this process
+ORGANIZATIONS_RATE_LIMITER = RateLimiter()
+
+
+def handle_nexttoken_and_retries(obj, collector_key, function, kwargs=dict(),
+        rate_limiter=None, max_retry=DEFAULT_MAX_RETRY):
+    """
+    Collect all pages of a paginated AWS Organizations API call, retrying on
+    TooManyRequestsException.  Calls are paced by ``rate_limiter``
+    [Default: ORGANIZATIONS_RATE_LIMITER].  A call is retried up to
+    ``max_retry`` times in a row before the exception is raised.
+    """
     message = {
         'FILE': __file__.split('/')[-1],
-        'FUNCTION': inspect.stack()[0][3],
+        'FUNCTION': 'handle_nexttoken_and_retries',
         'OBJECT': obj.__class__,
         'object_id': obj.id,
     }
     obj.logger.info(message)
-    max_retry = 4
+    if rate_limiter is None:
+        rate_limiter = ORGANIZATIONS_RATE_LIMITER
     retry_count = 0
     response = None
     next_token = None
     collector = []
     while response is None or next_token is not None:
+        rate_limiter.acquire()
         try:
             if next_token is None:
                 response = function(**kwargs)
@@ -178,15 +330,18 @@ def handle_nexttoken_and_retries(obj, collector_key, function, kwargs=dict()):
                 response = function(NextToken=next_token, **kwargs)
             next_token = response.get('NextToken')
             collector += response[collector_key]
+            rate_limiter.succeeded()
+            retry_count = 0
         except ClientError as e:
             if e.response['Error']['Code'] == 'TooManyRequestsException':
+                rate_limiter.throttled()
                 if retry_count < max_retry:
                     retry_count += 1
                     message['passed_function'] = function
                     message['error'] = 'TooManyRequestsException'
                     message['retry_count'] = retry_count
                     obj.logger.warning(message)
-                    time.sleep(1)
+                    rate_limiter.backoff(retry_count)
                     continue
                 else:
                     raise e
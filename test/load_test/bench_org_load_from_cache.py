@@ -0,0 +1,62 @@
+#!/usr/bin/env python
+"""
+Microbenchmark: time Org.load() from a warm cache file and report how much
+of that time is spent in logging.
+
+Runs against a moto mock organization, so no AWS credentials are needed::
+
+    python test/load_test/bench_org_load_from_cache.py [cycles]
+"""
+
+import os
+import sys
+import cProfile
+import pstats
+
+from moto import mock_organizations, mock_sts
+
+from orgcrawler import orgs, crawlers
+from orgcrawler.mock.org import (
+    MockOrganization,
+    MASTER_ACCOUNT_ID,
+    ORG_ACCESS_ROLE,
+)
+
+
+cycles = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+os.environ.setdefault('AWS_DEFAULT_REGION', 'us-east-1')
+
+with mock_sts(), mock_organizations():
+    MockOrganization().complex()
+    org = orgs.Org(MASTER_ACCOUNT_ID, ORG_ACCESS_ROLE, cache_file='cache_file-bench')
+    org.clear_cache()
+    org.load()
+
+    def load_from_cache():
+        for i in range(cycles):
+            orgs.Org(MASTER_ACCOUNT_ID, ORG_ACCESS_ROLE, cache_file='cache_file-bench').load()
+
+    timer = crawlers.CrawlerTimer()
+    profiler = cProfile.Profile()
+    timer.start()
+    profiler.runcall(load_from_cache)
+    timer.stop()
+    org.clear_cache()
+
+stats = pstats.Stats(profiler)
+total_time = stats.total_tt
+logging_modules = (
+    os.path.join('orgcrawler', 'logger.py'),
+    os.path.join('logging', '__init__.py'),
+    os.path.join('json', 'encoder.py'),
+    'inspect.py',
+)
+logging_time = sum(
+    stat[2] for func, stat in stats.stats.items()
+    if func[0].endswith(logging_modules)
+)
+
+print('cycles:', cycles)
+print('elapsed time:', round(timer.elapsed_time, 3))
+print('average time:', round(timer.elapsed_time / cycles, 5))
+print('time in logging: {:.1%}'.format(logging_time / total_time))
@@ -302,3 +302,163 @@ def test_execute_parameter_handling():
     assert execution.responses[0].payload_output['params'] == all_args
     execution = crawler.execute(mixed_params, 'cat', *two_args, kwarg1='horse', **two_kwargs)
     assert execution.responses[0].payload_output['params'] == all_args
+
+
+def test_crawler_scheduler():
+    import threading
+    from collections import Counter
+
+    class MockAccount(object):
+        def __init__(self, account_id):
+            self.id = account_id
+
+    accounts = [MockAccount(str(i)) for i in range(4)]
+    regions = ['us-east-1', 'us-west-2', 'eu-west-1']
+    tasks = [(a, r) for r in regions for a in accounts]
+    lock = threading.Lock()
+    running_by_account = Counter()
+    running_by_region = Counter()
+    peaks = dict(total=0, account=0, region=0)
+    completed = []
+
+    def task_func(task, completed):
+        account, region = task
+        with lock:
+            running_by_account[account.id] += 1
+            running_by_region[region] += 1
+            peaks['total'] = max(peaks['total'], sum(running_by_account.values()))
+            peaks['account'] = max(peaks['account'], running_by_account[account.id])
+            peaks['region'] = max(peaks['region'], running_by_region[region])
+        time.sleep(0.01)
+        with lock:
+            running_by_account[account.id] -= 1
+            running_by_region[region] -= 1
+        completed.append(task)
+
+    pool = utils.WorkerPool(max_workers=3)
+    scheduler = crawlers.CrawlerScheduler(pool, max_per_account=1, max_per_region=2)
+    scheduler.run(tasks, task_func, func_args=(completed,))
+    assert sorted(completed, key=id) == sorted(tasks, key=id)
+    assert peaks['total'] <= 3
+    assert peaks['account'] == 1
+    assert peaks['region'] <= 2
+    completed = []
+    crawlers.CrawlerScheduler(pool).run(tasks, task_func, func_args=(completed,))
+    assert len(completed) == len(tasks)
+    pool.shutdown()
+
+
+@mock_sts
+@mock_organizations
+def test_execute_with_concurrency_limits():
+    MockOrganization().simple()
+    org = orgs.Org(MASTER_ACCOUNT_ID, ORG_ACCESS_ROLE)
+    org.load()
+    crawler = crawlers.Crawler(org,
+        regions=['us-east-1', 'us-west-2'],
+        max_workers=2,
+        max_per_account=1,
+        max_per_region=1,
+    )
+    assert crawler.max_workers == 2
+    crawler.load_account_credentials()
+    execution = crawler.execute(positional_params, *args)
+    assert len(execution.responses) == len(crawler.accounts) * 2
+    assert execution.errors == 0
+    execution = crawler.execute(kwarg_params, thread_count=1, **kwargs)
+    assert execution.responses[0].payload_output['params'] == kwargs
+    assert crawler._worker_pool.max_workers == 1
+
+
+@mock_sts
+@mock_organizations
+def test_execute_async_payload():
+    MockOrganization().simple()
+    org = orgs.Org(MASTER_ACCOUNT_ID, ORG_ACCESS_ROLE)
+    org.load()
+    crawler = crawlers.Crawler(org, regions=['us-east-1', 'us-west-2'], max_per_account=1)
+    execution = crawler.execute(async_params, *args, kwarg1='horse', concurrency=2)
+    assert isinstance(execution, crawlers.CrawlerExecution)
+    assert execution.name == 'async_params'
+    assert len(execution.responses) == len(crawler.accounts) * 2
+    for response in execution.responses:
+        assert isinstance(response, crawlers.CrawlerResponse)
+        assert response.payload_output['params'] == dict(args_dict, kwarg1='horse')
+        assert isinstance(response.timer.elapsed_time, float)
+    with pytest.raises(SystemExit):
+        crawler.execute(async_bad_payload_func)
+    assert crawler.get_execution('async_bad_payload_func').errors == len(crawler.accounts) * 2
+
+
+@mock_sts
+@mock_organizations
+def test_execute_in_processes():
+    MockOrganization().simple()
+    org = orgs.Org(MASTER_ACCOUNT_ID, ORG_ACCESS_ROLE)
+    org.load()
+    crawler = crawlers.Crawler(org, regions=['us-east-1', 'us-west-2'])
+    execution = crawler.execute(mixed_params, *args, mode='process', thread_count=2, **kwargs)
+    assert len(execution.responses) == len(crawler.accounts) * 2
+    for response in execution.responses:
+        assert isinstance(response.account, orgs.OrgAccount)
+        assert response.payload_output['params'] == all_args
+        assert isinstance(response.timer.elapsed_time, float)
+    assert crawler._process_count == 2
+
+    account = crawlers.CrawlerProcessAccount(org.get_account('account01'))
+    assert account.name == 'account01'
+    assert account.dump()['credentials'] == {}
+    response = crawlers.run_payload_in_process_worker(
+        positional_params, 'us-east-1', account, ('cat',), {},
+    )
+    assert isinstance(response['exception'], TypeError)
+    assert 'Traceback' in response['traceback']
+
+    with pytest.raises(SystemExit):
+        crawler.execute(bad_payload_func, mode='process')
+    bad_execution = crawler.get_execution('bad_payload_func')
+    assert bad_execution.errors == len(bad_execution.responses)
+    exc_type, exception, tb = bad_execution.responses[0].exc_info
+    assert isinstance(exception.__cause__, crawlers.CrawlerRemoteTraceback)
+    with pytest.raises(ValueError):
+        crawler.execute(positional_params, mode='bogus')
+    crawler.close()
+    assert crawler._process_pool is None
+    assert crawler._worker_pool is None
+
+
+@mock_sts
+@mock_organizations
+def test_execute_iter():
+    MockOrganization().simple()
+    org = orgs.Org(MASTER_ACCOUNT_ID, ORG_ACCESS_ROLE)
+    org.load()
+    crawler = crawlers.Crawler(org, regions=['us-east-1', 'us-west-2'])
+    responses = crawler.execute_iter(positional_params, *args)
+    assert crawler.executions == []
+    count = 0
+    for response in responses:
+        assert isinstance(response, crawlers.CrawlerResponse)
+        assert response.payload_output['params'] == args_dict
+        count += 1
+    assert count == len(crawler.accounts) * 2
+    execution = crawler.get_execution('positional_params')
+    assert execution.responses == []
+    assert execution.errors == 0
+    assert isinstance(execution.timer.elapsed_time, float)
+
+    responses = list(crawler.execute_iter(async_params, *args, keep_responses=True))
+    assert crawler.executions[-1].responses == responses
+
+    responses = list(crawler.execute_iter(bad_payload_func, mode='process'))
+    assert all(r.exc_info is not None for r in responses)
+    assert crawler.executions[-1].errors == len(responses)
+
+    # closing the generator early stops unstarted payloads
+    crawler.update_regions(ALL_REGIONS)
+    responses = crawler.execute_iter(positional_params, *args, thread_count=1)
+    next(responses)
+    responses.close()
+    assert crawler.executions[-1].errors == 0
+    assert isinstance(crawler.executions[-1].timer.elapsed_time, float)
+    crawler.close()
@@ -52,3 +52,16 @@ def test_wrappers():
     except:
         errors.append(sys.exc_info()[0])
     assert len(errors) == 0
+
+
+def test_disabled_levels_skip_formatting():
+    my_logger = logger.Logger('warning')
+    assert not my_logger.is_enabled_for('info')
+    assert my_logger.is_enabled_for('warning')
+    calls = []
+    my_logger._format = lambda message: calls.append(message) or '"formatted"'
+    my_logger.debug('blee')
+    my_logger.info({'blee': 'blee'})
+    assert calls == []
+    my_logger.warning('blee')
+    assert calls == ['blee']
@@ -658,3 +658,194 @@ def test_get_accounts_for_policy_recursive():
     assert sorted([a.name for a in accounts_for_policy]) == ['account07', 'account09', 'account10']
     assert org.get_accounts_for_policy_recursive('Blee') is None
     org.clear_cache()
+
+
+@mock_sts
+@mock_organizations
+def test_lookup_indexes():
+    MockOrganization().simple()
+    org = orgs.Org(MASTER_ACCOUNT_ID, ORG_ACCESS_ROLE)
+    org.load()
+    assert org._index is not None
+    account = org.get_account('account01')
+    assert org._index['account_by_id'][account.id] == account
+    assert org._index['account_by_name']['account01'] == account
+    assert org.get_account(1234) is None
+    assert org.get_org_unit(dict(key='bogus')) is None
+
+    # indexes follow changes to the object lists
+    new_account = orgs.OrgAccount(
+        org,
+        name='account99',
+        id='998877665544',
+        email='account99@example.org',
+        aliases=['alias-account99'],
+    )
+    org.accounts.append(new_account)
+    assert org.get_account('account99') == new_account
+    assert org.get_account('alias-account99') == new_account
+    assert org.get_account_name_by_id('998877665544') == 'account99'
+    org.accounts = [a for a in org.accounts if a.name != 'account99']
+    assert org.get_account('account99') is None
+    org.policies = []
+    assert org.get_policy('policy01') is None
+    org.clear_cache()
+
+
+DEEP_ORG_SPEC = """
+root:
+  - name: root
+    accounts:
+    - name: account01
+    child_ou:
+      - name: ou01
+        accounts:
+        - name: account02
+        child_ou:
+          - name: ou01-1
+            child_ou:
+              - name: ou01-1-1
+                accounts:
+                - name: account03
+                child_ou:
+                  - name: ou01-1-1-1
+                    accounts:
+                    - name: account04
+      - name: ou02
+        accounts:
+        - name: account05
+"""
+
+
+@mock_sts
+@mock_organizations
+def test_list_in_ou_recursive_deep_tree():
+    MockOrganization().build(DEEP_ORG_SPEC)
+    org = orgs.Org(MASTER_ACCOUNT_ID, ORG_ACCESS_ROLE)
+    org.load()
+    response = org.list_org_units_in_ou_recursive('ou01')
+    assert sorted([ou.name for ou in response]) == ['ou01-1', 'ou01-1-1', 'ou01-1-1-1']
+    response = org.list_org_units_in_ou_recursive('root')
+    assert len(response) == len(org.org_units) == 5
+    response = org.list_accounts_in_ou_recursive('ou01')
+    assert sorted([a.name for a in response]) == ['account02', 'account03', 'account04']
+    response = org.list_accounts_in_ou_recursive('ou01-1')
+    assert sorted([a.name for a in response]) == ['account03', 'account04']
+    assert [a.name for a in org.list_accounts_in_ou('ou02')] == ['account05']
+    assert org.list_accounts_in_ou('bogus') == []
+    org.clear_cache()
+
+
+@mock_sts
+@mock_organizations
+def test_is_descendant():
+    MockOrganization().build(DEEP_ORG_SPEC)
+    org = orgs.Org(MASTER_ACCOUNT_ID, ORG_ACCESS_ROLE)
+    org.load()
+    assert org.is_descendant('account04', 'root')
+    assert org.is_descendant('account04', 'ou01')
+    assert org.is_descendant('account04', 'ou01-1-1-1')
+    assert org.is_descendant('account03', 'ou01-1')
+    assert not org.is_descendant('account03', 'ou01-1-1-1')
+    assert not org.is_descendant('account05', 'ou01')
+    assert not org.is_descendant('account01', 'ou01')
+    assert org.is_descendant(org.get_account('account01'), org.root_id)
+    assert org.is_descendant('ou01-1-1', 'ou01')
+    assert org.is_descendant(org.get_org_unit('ou02'), 'root')
+    assert not org.is_descendant('ou01', 'ou01')
+    assert not org.is_descendant('ou02', 'ou01')
+    assert not org.is_descendant('account01', 'bogus')
+    assert not org.is_descendant('bogus', 'root')
+    assert org.list_org_units_in_ou_recursive('bogus') == []
+    assert org.list_accounts_in_ou_recursive('bogus') == []
+    org.clear_cache()
+
+
+@mock_sts
+@mock_organizations
+def test_load_org_units_deep_tree():
+    MockOrganization().build(DEEP_ORG_SPEC)
+    org = orgs.Org(MASTER_ACCOUNT_ID, ORG_ACCESS_ROLE)
+    org._load_client()
+    org._load_org()
+    org._load_org_units()
+    assert sorted(org.list_org_units_by_name()) == [
+        'ou01', 'ou01-1', 'ou01-1-1', 'ou01-1-1-1', 'ou02',
+    ]
+    for ou in org.org_units:
+        assert isinstance(ou.attached_policy_ids, list)
+    assert org.get_org_unit('ou01-1-1-1').parent_id == org.get_org_unit_id('ou01-1-1')
+    assert org.get_org_unit('ou02').parent_id == org.root_id
+
+
+@mock_sts
+@mock_organizations
+def test_load_account_parents_by_ou():
+    MockOrganization().complex()
+    org = orgs.Org(MASTER_ACCOUNT_ID, ORG_ACCESS_ROLE)
+    org.clear_cache()
+    org.load()
+    org_by_ou = orgs.Org(MASTER_ACCOUNT_ID, ORG_ACCESS_ROLE,
+        cache_file='cache_file-by-ou',
+        account_parents_by_ou=True,
+    )
+    org_by_ou._load_client()
+    org_by_ou._load_org()
+    org_by_ou._load_accounts()
+    for account in org_by_ou.accounts:
+        assert account.parent_id is None
+    org_by_ou._load_org_units()
+    for account in org_by_ou.accounts:
+        assert account.parent_id == org.get_account(account.id).parent_id
+    assert 'account_parents_by_ou' not in str(org_by_ou.dump().keys())
+    org.clear_cache()
+
+
+@mock_sts
+@mock_organizations
+def test_load_policy_ids_from_targets():
+    MockOrganization().complex()
+    org = orgs.Org(MASTER_ACCOUNT_ID, ORG_ACCESS_ROLE)
+    org.clear_cache()
+    org.load()
+    org_from_targets = orgs.Org(MASTER_ACCOUNT_ID, ORG_ACCESS_ROLE,
+        cache_file='cache_file-from-targets',
+        account_parents_by_ou=True,
+        policy_ids_from_targets=True,
+    )
+    org_from_targets.load()
+    for account in org_from_targets.accounts:
+        expected = org.get_account(account.id)
+        assert account.parent_id == expected.parent_id
+        assert sorted(account.attached_policy_ids) == sorted(expected.attached_policy_ids)
+    for ou in org_from_targets.org_units:
+        expected = org.get_org_unit(ou.id)
+        assert sorted(ou.attached_policy_ids) == sorted(expected.attached_policy_ids)
+    assert org_from_targets.get_accounts_for_policy_recursive('policy05') is not None
+    org.clear_cache()
+
+
+@mock_sts
+@mock_organizations
+def test_load_pipelined():
+    MockOrganization().complex()
+    org = orgs.Org(MASTER_ACCOUNT_ID, ORG_ACCESS_ROLE)
+    org.clear_cache()
+    org.load()
+    for options in [
+            dict(pipelined_load=True),
+            dict(pipelined_load=True, thread_count=2,
+                account_parents_by_ou=True, policy_ids_from_targets=True)]:
+        org_pipelined = orgs.Org(MASTER_ACCOUNT_ID, ORG_ACCESS_ROLE,
+            cache_file='cache_file-pipelined', **options)
+        org_pipelined.clear_cache()
+        org_pipelined.load()
+        assert '_worker_pool' not in org_pipelined.dump()
+        assert sorted(org_pipelined.list_accounts_by_id()) == sorted(org.list_accounts_by_id())
+        assert sorted(org_pipelined.list_org_units_by_id()) == sorted(org.list_org_units_by_id())
+        assert sorted(org_pipelined.list_policies_by_id()) == sorted(org.list_policies_by_id())
+        for account in org_pipelined.accounts:
+            expected = org.get_account(account.id)
+            assert account.parent_id == expected.parent_id
+            assert sorted(account.attached_policy_ids) == sorted(expected.attached_policy_ids)
+    org.clear_cache()
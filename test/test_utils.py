@@ -91,6 +91,48 @@ def test_queue_threads():
         assert re.compile(r'item-[0-9]').match(item)
     assert int((stoptime - starttime) *10) < 5
 
+    def raise_value_error(item):
+        raise ValueError('item {}'.format(item))
+    with pytest.raises(ValueError):
+        utils.queue_threads(range(3), raise_value_error)
+
+
+def test_worker_pool():
+    import threading
+    pool = utils.WorkerPool(max_workers=4)
+    thread_names = set()
+
+    def square(item, offset):
+        thread_names.add(threading.current_thread().name)
+        if item == 3:
+            raise ValueError('bad item')
+        time.sleep(0.01)
+        return item * item + offset
+
+    results = pool.map(square, range(8), func_args=(1,))
+    assert [r.item for r in results] == list(range(8))
+    assert [r.result for r in results if r.exc_info is None] == [1, 2, 5, 17, 26, 37, 50]
+    assert results[3].exc_info[0] == ValueError
+    with pytest.raises(ValueError):
+        results[3].reraise()
+    results = pool.map(square, range(8, 16), func_args=(0,))
+    assert all(r.exc_info is None for r in results)
+    # threads are reused across calls and never exceed max_workers
+    assert len(thread_names) <= 4
+
+    cancel_event = threading.Event()
+    cancel_event.set()
+    results = pool.map(square, range(4), func_args=(0,), cancel_event=cancel_event)
+    assert all(r.cancelled for r in results)
+
+    pool_of_one = utils.WorkerPool(max_workers=1)
+    results = pool_of_one.map(square, [3, 4, 5], func_args=(0,), stop_on_error=True)
+    assert results[0].exc_info is not None
+    assert results[1].cancelled and results[2].cancelled
+    assert pool.submit(square, 2, 0).result() == 4
+    pool.shutdown()
+    pool_of_one.shutdown()
+
 
 def test_regions_for_service():
     regions = utils.regions_for_service('lambda')
@@ -139,6 +181,8 @@ def test_handle_nexttoken_and_retries():
             collector_key='mock-key',
             function=mock_function_raise_client_error,
             kwargs=dict(error_code=exception_name),
+            rate_limiter=utils.RateLimiter(base_delay=0.01),
+            max_retry=4,
         )
     assert e.value.response['Error']['Code'] == exception_name
 
@@ -159,3 +203,51 @@ def test_handle_nexttoken_and_retries():
             function=mock_function_raise_value_error,
             kwargs=dict(),
         )
+
+
+def test_rate_limiter():
+    limiter = utils.RateLimiter(rate=50.0, burst=5, min_rate=1.0, max_rate=60.0,
+        increase=1.0, decrease=0.5, base_delay=0.01)
+    starttime = time.perf_counter()
+    for i in range(5):
+        limiter.acquire()
+    assert time.perf_counter() - starttime < 0.05
+    for i in range(10):
+        limiter.acquire()
+    # 10 calls beyond the burst at 50 calls/second
+    assert time.perf_counter() - starttime >= 0.15
+    limiter.succeeded()
+    assert limiter.rate == 51.0
+    for i in range(20):
+        limiter.succeeded()
+    assert limiter.rate == 60.0
+    limiter.throttled()
+    assert limiter.rate == 30.0
+    for i in range(10):
+        limiter.throttled()
+    assert limiter.rate == 1.0
+    starttime = time.perf_counter()
+    limiter.backoff(1)
+    assert time.perf_counter() - starttime < 0.1
+
+
+def test_handle_nexttoken_and_retries_recovers_from_throttling():
+    calls = []
+
+    def mock_function_throttle_twice(**kwargs):
+        calls.append(kwargs)
+        if len(calls) <= 2:
+            raise ClientError({'Error': {'Code': 'TooManyRequestsException'}}, 'mock_function')
+        return {'mock-key': ['item']}
+
+    limiter = utils.RateLimiter(base_delay=0.01)
+    org = orgs.Org(MASTER_ACCOUNT_ID, ORG_ACCESS_ROLE)
+    collector = utils.handle_nexttoken_and_retries(
+        obj=org,
+        collector_key='mock-key',
+        function=mock_function_throttle_twice,
+        rate_limiter=limiter,
+    )
+    assert collector == ['item']
+    assert len(calls) == 3
+    assert limiter.rate < 10.0